@@ -1,20 +1,26 @@
+import asyncio
+import base64
+import io
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
 import os
-from dataclasses import dataclass
-from typing import List, Optional
+import struct
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
+import numpy as np
 from serial.tools import list_ports
-from pymodbus.client import ModbusSerialClient
-from PIL import Image, ImageTk
+from pymodbus.client import AsyncModbusSerialClient
 
 
 # ----------------------------
 # Register model
 # ----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegItem:
     offset: int
     name: str
@@ -23,48 +29,256 @@ class RegItem:
     dtype: str = "float32"
     count: int = 2        # float32 = 2 regs
     scale: float = 1.0
+    address: int = field(init=False, compare=False)   # offset - 1
 
-    @property
-    def address(self) -> int:
-        return self.offset - 1
+    def __post_init__(self):
+        object.__setattr__(self, "address", self.offset - 1)
 
 
 # ----------------------------
 # Helpers
 # ----------------------------
+_USB_KEYS = ("usbserial", "usbmodem", "wchusbserial", "slab_usbto")
+_NOISE_KEYS = ("bluetooth", "debug-console", "internalmodem")
+
+
 def list_serial_ports_preferred() -> List[str]:
     """
     On macOS you'll see many /dev/cu.* entries (Bluetooth etc.)
     We prefer real USB serial ports first, but still show others.
     """
-    ports = [p.device for p in list_ports.comports()]
-
-    def is_noise(p: str) -> bool:
+    usb, other, noise = [], [], []
+    for p in (x.device for x in list_ports.comports()):
         s = p.lower()
-        return ("bluetooth" in s) or ("debug-console" in s) or ("internalmodem" in s)
-
-    def is_usb(p: str) -> bool:
-        s = p.lower()
-        return ("usbserial" in s) or ("usbmodem" in s) or ("wchusbserial" in s) or ("slab_usbto" in s)
-
-    usb = [p for p in ports if is_usb(p)]
-    other = [p for p in ports if (p not in usb) and (not is_noise(p))]
-    noise = [p for p in ports if is_noise(p)]
+        if any(k in s for k in _USB_KEYS):
+            usb.append(p)
+        elif any(k in s for k in _NOISE_KEYS):
+            noise.append(p)
+        else:
+            other.append(p)
 
     # Show USB first, then other useful, keep noise last (still available if needed)
     return usb + other + noise
 
 
-def decode_float32(regs: List[int], swap_words: bool = False) -> Optional[float]:
-    if regs is None or len(regs) < 2:
+ASYNC_LOW_LATENCY = 1 << 13     # linux/tty_flags.h
+
+
+def set_low_latency(port: str) -> Optional[str]:
+    """
+    Ask the USB-serial driver to hand received bytes over immediately instead
+    of waiting for its latency timer (16 ms by default on FTDI), which would
+    otherwise add up to 16 ms to every Modbus reply.
+    Linux only: tries /sys/bus/usb-serial/devices/<tty>/latency_timer first,
+    then the ASYNC_LOW_LATENCY flag via TIOCSSERIAL. On macOS the FTDI
+    latency is an IOKit driver property (kext Info.plist / ConfigData), and
+    on Windows it is the "Latency Timer" in the COM port's Advanced settings.
+    Returns a short description of what was changed, or None.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    tty = os.path.basename(os.path.realpath(port))
+    sysfs = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    try:
+        with open(sysfs, "w") as f:
+            f.write("1")
+        return f"{sysfs} = 1"
+    except OSError:
+        pass
+
+    import fcntl
+    import termios
+    get_serial = getattr(termios, "TIOCGSERIAL", 0x541E)
+    set_serial = getattr(termios, "TIOCSSERIAL", 0x541F)
+    try:
+        fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buf = bytearray(128)    # >= sizeof(struct serial_struct)
+        fcntl.ioctl(fd, get_serial, buf)
+        flags_off = 16          # int type, line; unsigned port; int irq; int flags
+        flags = struct.unpack_from("i", buf, flags_off)[0]
+        if flags & ASYNC_LOW_LATENCY:
+            return None
+        struct.pack_into("i", buf, flags_off, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, set_serial, buf)
+        return f"{port}: ASYNC_LOW_LATENCY set"
+    except OSError:
         return None
-    hi = int(regs[0]) & 0xFFFF
-    lo = int(regs[1]) & 0xFFFF
+    finally:
+        os.close(fd)
+
+
+def set_timer_resolution(high: bool):
+    """
+    Windows only: request 1 ms timer resolution while polling (the default
+    ~15.6 ms tick makes Event.wait() wake up late). No-op elsewhere.
+    Every set_timer_resolution(True) must be paired with a False call.
+    """
+    if sys.platform != "win32":
+        return
+    import ctypes
+    try:
+        if high:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    except Exception:
+        pass
+
+
+def decode_float32_block(regs: List[int], offsets: List[int], swap_words: bool = False) -> np.ndarray:
+    """
+    Decode several float32 values from one block of registers in a single pass.
+    offsets[i] is the index of the first word of value i inside regs.
+    """
+    words = np.asarray(regs, dtype=np.uint16)
+    idx = np.asarray(offsets, dtype=np.intp)
+    pairs = words[np.add.outer(idx, (0, 1))]
     if swap_words:
-        hi, lo = lo, hi
-    raw = (hi << 16) | lo
-    import struct
-    return struct.unpack(">f", struct.pack(">I", raw))[0]
+        pairs = pairs[:, ::-1]
+    return np.ascontiguousarray(pairs, dtype=">u2").view(">f4").ravel()
+
+
+_numba_kernels = None     # None = not loaded yet, () = numba not installed
+
+
+def load_numba_kernels() -> tuple:
+    """
+    Import numba and define the compiled decoders on first use, so the
+    numba import (~200 ms) stays off the startup path; the first poll pays
+    it on the poll thread instead. Returns (decode_block, decode_block_batch),
+    or () when numba is not installed and the numpy decoder is used.
+    """
+    global _numba_kernels
+    if _numba_kernels is not None:
+        return _numba_kernels
+    try:
+        from numba import njit
+    except ImportError:
+        _numba_kernels = ()
+        return _numba_kernels
+
+    @njit(cache=True, nogil=True)
+    def decode_block(words, offsets, swap_words):
+        """Compiled word-pair -> float32 kernel (words: uint16, offsets: intp)."""
+        raw = np.empty(offsets.size, np.uint32)
+        for i in range(offsets.size):
+            hi = np.uint32(words[offsets[i]])
+            lo = np.uint32(words[offsets[i] + 1])
+            if swap_words:
+                hi, lo = lo, hi
+            raw[i] = (hi << 16) | lo
+        return raw.view(np.float32)
+
+    @njit(cache=True, nogil=True)
+    def decode_block_batch(words, offsets, swap_words, scales, out):
+        """Compiled whole-table kernel: out[i] = float32 at words[offsets[i]] * scales[i]."""
+        vals = decode_block(words, offsets, swap_words)
+        for i in range(offsets.size):
+            out[i] = vals[i] * scales[i]
+
+    _numba_kernels = (decode_block, decode_block_batch)
+    return _numba_kernels
+
+
+def decode_table(words: np.ndarray, offsets: np.ndarray, swap_words: bool,
+                 scales: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Decode and scale every float32 of the register table in one pass.
+    words holds all blocks back to back (uint16); offsets[i] is the first word
+    of value i in words. Results are written to out (float64) and returned.
+    """
+    kernels = load_numba_kernels()
+    if kernels:
+        kernels[1](words, offsets, swap_words, scales, out)
+    else:
+        np.multiply(decode_float32_block(words, offsets, swap_words), scales, out=out)
+    return out
+
+
+LOGO_HEIGHT = 80
+
+
+def scaled_logo(target_h: int) -> dict:
+    """
+    Return tk.PhotoImage keyword args for images/logo.png scaled to target_h
+    (keeping aspect ratio). The scaled copy is made once with PIL and saved as
+    images/logo_<h>.png, so normal startups don't import PIL at all. If
+    images/ is read-only the scaled PNG is passed to Tk in memory instead.
+    """
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "logo.png")
+    path = os.path.join(os.path.dirname(src), f"logo_{target_h}.png")
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(src):
+        return {"file": path}
+
+    from PIL import Image
+    img = Image.open(src)
+    w, h = img.size
+    scale = target_h / h
+    img = img.resize((max(1, int(w * scale)), target_h), Image.LANCZOS)
+    try:
+        img.save(path)
+        return {"file": path}
+    except OSError:
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        return {"data": base64.b64encode(buf.getvalue()).decode("ascii")}
+
+
+# ----------------------------
+# Block read planning
+# ----------------------------
+# Registers of the same function code closer than BLOCK_GAP words are read in
+# one request (the gap words are read and discarded). Set to 0 if the meter
+# rejects reads spanning unmapped registers.
+BLOCK_GAP = 4
+MAX_BLOCK_REGS = 125      # Modbus limit for FC3/FC4
+
+# (fc, start_address, count, [(reg_index, offset_in_block), ...])
+ReadBlock = Tuple[int, int, int, List[Tuple[int, int]]]
+
+
+def plan_block_reads(regs: List[RegItem], gap: int = BLOCK_GAP,
+                     max_count: int = MAX_BLOCK_REGS) -> List[ReadBlock]:
+    """
+    Group registers into as few Modbus requests as possible.
+    Registers are sorted by (fc, address) and merged greedily while the hole
+    to the next register is <= gap and the block stays within max_count.
+    """
+    order = sorted(range(len(regs)), key=lambda i: (regs[i].fc, regs[i].address))
+    blocks: List[ReadBlock] = []
+    for i in order:
+        reg = regs[i]
+        if blocks:
+            fc, start, count, members = blocks[-1]
+            end = reg.address + reg.count
+            if (fc == reg.fc
+                    and reg.address - (start + count) <= gap
+                    and end - start <= max_count):
+                members.append((i, reg.address - start))
+                blocks[-1] = (fc, start, max(count, end - start), members)
+                continue
+        blocks.append((reg.fc, reg.address, reg.count, [(i, 0)]))
+    return blocks
+
+
+def block_layout(blocks: List[ReadBlock], n_regs: int) -> Tuple[List[int], np.ndarray, int]:
+    """
+    Lay the blocks out back to back in one word buffer.
+    Returns (base of each block, word offset of each register, total words).
+    """
+    bases: List[int] = []
+    offsets = np.zeros(n_regs, dtype=np.intp)
+    total = 0
+    for _, _, count, members in blocks:
+        bases.append(total)
+        for idx, off in members:
+            offsets[idx] = total + off
+        total += count
+    return bases, offsets, total
 
 
 # ----------------------------
@@ -102,23 +316,42 @@ DEFAULT_REGS: List[RegItem] = [
 ]
 
 
+UI_DRAIN_MS = 100
+
+
 class EM6400NGApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("EM6400NG RS-485 Reader (Modbus RTU)")
         self.geometry("1020x620")
 
-        self.client: Optional[ModbusSerialClient] = None
         self.connected = False
-        self.polling = False
+        self._conn_desc = ""
         self.poll_thread: Optional[threading.Thread] = None
 
         self.regs: List[RegItem] = list(DEFAULT_REGS)
+        self._poll_plan: List[ReadBlock] = []
+        self._last_vals: List[str] = [""] * len(self.regs)
+
+        # Stop event of the current poll thread; a new one per connection so
+        # a thread still finishing a slow poll can't be revived by clear()
+        self._stop: Optional[threading.Event] = None
+        self._poll_s = 1.0
+
+        # Written by the poll thread, applied to the widgets by _drain_ui on
+        # the main thread (the poll thread never calls into Tk)
+        self._log_q: deque = deque(maxlen=500)
+        self._pending_values: Optional[List[str]] = None
+        self._pending_connect: Optional[bool] = None
+        self._pending_exit: Optional[bool] = None      # poll thread ended; True if the port had been open
+        self._pending_logo = None       # PhotoImage args for the logo, or the load error
+        self._ui_lock = threading.Lock()
 
         self._build_ui()
         self._refresh_ports()
         self._render_regs()
         self._log("Ready.")
+        self.after(UI_DRAIN_MS, self._drain_ui)
 
     def _build_ui(self):
         # Top row
@@ -129,25 +362,10 @@ class EM6400NGApp(tk.Tk):
         logo_frame = ttk.Frame(top)
         logo_frame.pack(side=tk.LEFT, padx=(0, 12), anchor="n")
 
-        try:
-            logo_path = os.path.join(os.path.dirname(__file__), "images", "logo.png")
-            img = Image.open(logo_path)
-            target_h = 80
-            w, h = img.size
-            scale = target_h / h
-            new_size = (max(1, int(w * scale)), target_h)
-            img = img.resize(new_size, Image.LANCZOS)
-            self.logo_img = ImageTk.PhotoImage(img)
-            ttk.Label(logo_frame, image=self.logo_img).pack(anchor="nw")
-        except Exception as e:
-            ttk.Label(
-                logo_frame,
-                text="LOGO\nmissing",
-                width=16,
-                anchor="center",
-                relief="groove"
-            ).pack(ipadx=8, ipady=12)
-            print("Logo load error:", e)
+        # Filled in by _install_logo once _load_logo_async has the file ready
+        self._logo_label = ttk.Label(logo_frame)
+        self._logo_label.pack(anchor="nw")
+        threading.Thread(target=self._load_logo_async, daemon=True).start()
 
         # Connection
         conn = ttk.LabelFrame(top, text="Connection", padding=10)
@@ -174,13 +392,19 @@ class EM6400NGApp(tk.Tk):
 
         ttk.Label(conn, text="Slave ID").grid(row=3, column=0, sticky="w", pady=(6, 0))
         self.slave_var = tk.StringVar(value="1")
+        self.slave_var.trace_add("write", self._on_slave_change)
+        self._on_slave_change()
         ttk.Entry(conn, textvariable=self.slave_var, width=37).grid(row=3, column=1, sticky="w", padx=6, pady=(6, 0))
 
         ttk.Label(conn, text="Poll (ms)").grid(row=4, column=0, sticky="w", pady=(6, 0))
         self.poll_ms_var = tk.StringVar(value="1000")
+        self.poll_ms_var.trace_add("write", self._on_poll_ms_change)
+        self._on_poll_ms_change()
         ttk.Entry(conn, textvariable=self.poll_ms_var, width=37).grid(row=4, column=1, sticky="w", padx=6, pady=(6, 0))
 
         self.swap_words_var = tk.BooleanVar(value=False)
+        self.swap_words_var.trace_add("write", self._on_swap_words_change)
+        self._on_swap_words_change()
         ttk.Checkbutton(conn, text="Swap 16-bit words (if values wrong)", variable=self.swap_words_var)\
             .grid(row=5, column=0, columnspan=2, sticky="w", pady=(6, 0))
 
@@ -240,6 +464,32 @@ class EM6400NGApp(tk.Tk):
         ttk.Button(log_frame, text="Clear Log", command=lambda: self.log.delete("1.0", tk.END))\
             .grid(row=0, column=2, padx=(8, 0), sticky="ne")
 
+    def _load_logo_async(self):
+        # Scaling (first run only) happens here; Tk objects are created on
+        # the main thread in _install_logo
+        try:
+            result = scaled_logo(LOGO_HEIGHT)
+        except Exception as e:
+            result = e
+        with self._ui_lock:
+            self._pending_logo = result
+
+    def _install_logo(self, result):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            self.logo_img = tk.PhotoImage(**result)
+            self._logo_label.configure(image=self.logo_img)
+        except Exception as e:
+            self._logo_label.configure(
+                text="LOGO\nmissing",
+                width=16,
+                anchor="center",
+                relief="groove"
+            )
+            self._logo_label.pack_configure(ipadx=8, ipady=12)
+            print("Logo load error:", e)
+
     # ----------------------------
     # Core
     # ----------------------------
@@ -256,14 +506,39 @@ class EM6400NGApp(tk.Tk):
 
         self._log(f"Ports: {ports if ports else 'No ports found'}")
 
+    def _on_slave_change(self, *_):
+        # Cached as a plain int so the poll thread never touches Tk variables
+        try:
+            self._slave_id = int(self.slave_var.get())
+        except Exception:
+            self._slave_id = 1
+
+    def _on_poll_ms_change(self, *_):
+        try:
+            poll_ms = int(self.poll_ms_var.get())
+            if poll_ms < 200:
+                poll_ms = 200
+        except Exception:
+            poll_ms = 1000
+        self._poll_s = poll_ms / 1000.0
+
+    def _on_swap_words_change(self, *_):
+        self._swap_words = bool(self.swap_words_var.get())
+
     def _render_regs(self):
+        self._poll_plan = plan_block_reads(self.regs)
+        # Whole-table decode layout: each poll thread copies every block into
+        # its own word buffer and decode_table decodes it in one pass
+        self._block_bases, self._word_offsets, self._total_words = block_layout(self._poll_plan, len(self.regs))
+        self._scales = np.array([r.scale for r in self.regs], dtype=np.float64)
+        self._last_vals = [""] * len(self.regs)
         self.tree.delete(*self.tree.get_children())
         for i, r in enumerate(self.regs):
             self.tree.insert("", tk.END, iid=str(i),
                              values=(r.name, r.fc, r.offset, r.address, r.unit, ""))
 
     def _connect(self):
-        if self.connected:
+        if self.connected or self.poll_thread:
             return
 
         port = (self.port_var.get() or "").strip()
@@ -285,100 +560,217 @@ class EM6400NGApp(tk.Tk):
             messagebox.showerror("Error", "Parity must be E, O, or N.")
             return
 
-        self.client = ModbusSerialClient(
-            port=port,
-            baudrate=baud,
-            parity=parity,
-            stopbits=1,
-            bytesize=8,
-            timeout=1.0
-        )
+        self._conn_desc = f"{port}  {baud}  8{parity}1  Slave {slave}"
+        self.connect_btn.config(state="disabled")
+        self.status_var.set(f"Connecting: {self._conn_desc}")
+
+        # The port is opened by the poll thread; the result comes back
+        # through _drain_ui -> _on_connect_result, and Connect is enabled
+        # again only once the thread has ended (_on_poll_thread_exit)
+        self._stop = threading.Event()
+        self.poll_thread = threading.Thread(target=self._poll_loop, args=(port, baud, parity, self._stop),
+                                            daemon=True)
+        self.poll_thread.start()
 
-        ok = self.client.connect()
+    def _on_connect_result(self, ok: bool):
         if not ok:
-            self.client = None
+            self.status_var.set("Not connected")
             messagebox.showerror("Error", "Failed to open port. Check USB-RS485 driver/port.")
             return
 
         self.connected = True
-        self.connect_btn.config(state="disabled")
         self.disconnect_btn.config(state="normal")
-        self.status_var.set(f"Connected: {port}  {baud}  8{parity}1  Slave {slave}")
+        self.status_var.set(f"Connected: {self._conn_desc}")
         self._log("Connected OK.")
 
-        self.polling = True
-        self.poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
-        self.poll_thread.start()
-
     def _disconnect(self):
-        self.polling = False
-        time.sleep(0.1)
-        if self.client:
-            try:
-                self.client.close()
-            except Exception:
-                pass
-        self.client = None
+        # Don't join here: a poll against a silent meter can take several
+        # seconds and would freeze the UI. The thread reports when it is done.
+        if self._stop:
+            self._stop.set()
+        self.connected = False
+        self.disconnect_btn.config(state="disabled")
+        self.status_var.set("Disconnecting...")
+
+    def _on_poll_thread_exit(self, was_open: bool):
+        self.poll_thread = None
+        self._stop = None
         self.connected = False
         self.connect_btn.config(state="normal")
         self.disconnect_btn.config(state="disabled")
         self.status_var.set("Not connected")
-        self._log("Disconnected.")
-
-    def _poll_loop(self):
-        while self.polling:
-            try:
-                poll_ms = int(self.poll_ms_var.get())
-                if poll_ms < 200:
-                    poll_ms = 200
-            except Exception:
-                poll_ms = 1000
-
-            if self.connected and self.client:
-                self._poll_once()
-
-            time.sleep(poll_ms / 1000.0)
-
-    def _poll_once(self):
+        if was_open:
+            self._log("Disconnected.")
+
+    def _poll_loop(self, port: str, baud: int, parity: str, stop: threading.Event):
+        # The poll thread owns the asyncio loop and the Modbus client; the
+        # loop only runs while a connect or a poll is in progress
+        loop = asyncio.new_event_loop()
+
+        async def make_client():
+            # pymodbus binds its transport to the running loop on creation
+            return AsyncModbusSerialClient(
+                port=port,
+                baudrate=baud,
+                parity=parity,
+                stopbits=1,
+                bytesize=8,
+                timeout=1.0
+            )
+
+        client = None
+        ok = False
         try:
-            slave = int(self.slave_var.get())
-        except Exception:
-            slave = 1
-
-        swap_words = bool(self.swap_words_var.get())
-
-        for idx, reg in enumerate(self.regs):
             try:
-                if reg.fc == 3:
-                    rr = self.client.read_holding_registers(reg.address, reg.count, slave=slave)
-                else:
-                    rr = self.client.read_input_registers(reg.address, reg.count, slave=slave)
-
+                client = loop.run_until_complete(make_client())
+                ok = loop.run_until_complete(client.connect())
+            except Exception as e:
+                self._log(f"Connect: Exception {e}")
+                ok = False
+            with self._ui_lock:
+                self._pending_connect = ok
+            if not ok:
+                return
+
+            note = set_low_latency(port)
+            if note:
+                self._log(f"Low latency: {note}")
+
+            # Everything the polls touch is local to this thread, so a thread
+            # still finishing after a disconnect can't disturb the next one.
+            # The read method per block is resolved once, not per poll.
+            read_plan = [
+                (client.read_holding_registers if fc == 3 else client.read_input_registers,
+                 start, count, members, base)
+                for (fc, start, count, members), base in zip(self._poll_plan, self._block_bases)
+            ]
+            words = np.zeros(self._total_words, dtype=np.uint16)
+            out = np.zeros(len(self.regs), dtype=np.float64)
+
+            # Fixed cadence: the next poll is due one interval after the
+            # previous one was due, regardless of how long the scan took
+            set_timer_resolution(True)
+            try:
+                next_t = time.monotonic()
+                while not stop.is_set():
+                    loop.run_until_complete(self._poll_once(read_plan, words, out))
+                    next_t += self._poll_s
+                    now = time.monotonic()
+                    if next_t < now:        # scan overran the interval; don't burst to catch up
+                        next_t = now
+                    stop.wait(next_t - now)
+            finally:
+                set_timer_resolution(False)
+        except Exception as e:
+            # Anything outside the per-block handling ends polling; say why
+            self._log(f"Poll thread: Exception {e}")
+        finally:
+            if client is not None:
+                try:
+                    client.close()
+                    loop.run_until_complete(asyncio.sleep(0))   # let the transport finish closing
+                except Exception:
+                    pass
+            loop.close()
+            with self._ui_lock:
+                self._pending_exit = ok
+
+    async def _poll_once(self, read_plan: list, words: np.ndarray, out: np.ndarray):
+        # RTU allows one outstanding request per bus, so blocks are still
+        # requested one after another; a finished block is checked and copied
+        # into words by _collect_blocks while the next request is on the
+        # wire, then the whole table is decoded at once into out.
+        slave = self._slave_id
+        swap_words = self._swap_words
+        results = [""] * len(self.regs)
+
+        pending: asyncio.Queue = asyncio.Queue()
+        collector = asyncio.ensure_future(self._collect_blocks(pending, results, words))
+
+        for read, start, count, members, base in read_plan:
+            try:
+                rr = await read(start, count=count, slave=slave)
+            except Exception as e:
+                for idx, _ in members:
+                    results[idx] = "EXC"
+                self._log(f"{read.__name__}({start}, {count}): Exception {e}")
+                continue
+            pending.put_nowait((read, start, count, members, base, rr))
+
+        pending.put_nowait(None)
+        await collector
+
+        values = decode_table(words, self._word_offsets, swap_words, self._scales, out)
+        labels = np.char.mod("%.4f", values).tolist()
+        for idx, txt in enumerate(results):
+            if txt:                 # ERR / N/A / EXC from the block checks
+                labels[idx] = txt
+
+        with self._ui_lock:
+            self._pending_values = labels
+
+    async def _collect_blocks(self, pending: asyncio.Queue, results: List[str], words: np.ndarray):
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            read, start, count, members, base, rr = item
+            try:
                 if rr.isError():
-                    val_txt = "ERR"
-                    self._log(f"{reg.name}: {rr}")
-                else:
-                    v = decode_float32(rr.registers, swap_words=swap_words)
-                    val_txt = "N/A" if v is None else f"{(v * reg.scale):.4f}"
+                    self._log(f"{read.__name__}({start}, {count}): {rr}")
+                    for idx, _ in members:
+                        results[idx] = "ERR"
+                    continue
 
-                self.after(0, self._set_tree_value, idx, val_txt)
+                if len(rr.registers) < count:
+                    for idx, _ in members:
+                        results[idx] = "N/A"
+                    continue
+
+                words[base:base + count] = rr.registers[:count]
 
             except Exception as e:
-                self.after(0, self._set_tree_value, idx, "EXC")
-                self._log(f"{reg.name}: Exception {e}")
+                for idx, _ in members:
+                    results[idx] = "EXC"
+                self._log(f"{read.__name__}({start}, {count}): Exception {e}")
 
-    def _set_tree_value(self, idx: int, val_txt: str):
-        iid = str(idx)
-        if self.tree.exists(iid):
-            self.tree.set(iid, "value", val_txt)
+    def _apply_values(self, values: List[str]):
+        if len(values) != len(self.regs):
+            return
+        last = self._last_vals
+        for i, v in enumerate(values):
+            if v != last[i]:
+                self.tree.set(str(i), "value", v)
+                last[i] = v
 
     def _log(self, s: str):
         ts = time.strftime("%H:%M:%S")
-        try:
-            self.log.insert(tk.END, f"[{ts}] {s}\n")
-            self.log.see(tk.END)
-        except Exception:
-            print(f"[{ts}] {s}")
+        with self._ui_lock:
+            self._log_q.append(f"[{ts}] {s}\n")
+
+    def _drain_ui(self):
+        with self._ui_lock:
+            lines = "".join(self._log_q)
+            self._log_q.clear()
+            values, self._pending_values = self._pending_values, None
+            conn_ok, self._pending_connect = self._pending_connect, None
+            exited, self._pending_exit = self._pending_exit, None
+            logo, self._pending_logo = self._pending_logo, None
+        if logo is not None:
+            self._install_logo(logo)
+        if conn_ok is not None:
+            self._on_connect_result(conn_ok)
+        if exited is not None:
+            self._on_poll_thread_exit(exited)
+        if values is not None:
+            self._apply_values(values)
+        if lines:
+            try:
+                self.log.insert(tk.END, lines)
+                self.log.see(tk.END)
+            except Exception:
+                print(lines, end="")
+        self.after(UI_DRAIN_MS, self._drain_ui)
 
 
 if __name__ == "__main__":